@@ -7,6 +7,26 @@ import asyncio
 import aiohttp
 import logging
 import functools
+import contextlib
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from multidict import CIMultiDict
+from aiohttp.resolver import AsyncResolver, DefaultResolver, ThreadedResolver
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ujson
+except ImportError:
+    ujson = None
 
 log = logging.getLogger(__name__)
 
@@ -50,13 +70,68 @@ def exponential_backoff_with_jitter(attempt):
     jitter = random.random() # gives fractional value between 0/1
     return min(jitter + base ** attempt, max_sleep)
 
+def full_jitter_backoff(attempt, base=0.2, cap=30):
+    """An exponential backoff with full jitter callable.
+
+    Sleeps a random time between zero and the exponential backoff so that
+    concurrent requests retrying after a failure don't all retry together.
+    Use functools.partial to change the base or cap.
+
+    :param attempt: the number of failed attempts so far.
+    :type attempt: int
+    :param base: seconds to back off after the first attempt. Default: 0.2
+    :type base: int or float
+    :param cap: maximum seconds to back off. Default: 30
+    :type cap: int or float
+    :returns: seconds to sleep before next request.
+    :rtype: float
+    """
+    return random.uniform(0, min(cap, base * (1 << min(attempt, 16))))
+
+def _orjson_dumps(obj):
+    """Serialize to a JSON str with orjson, which returns bytes.
+
+    :param obj: the object to serialize.
+    :type obj: any
+    :returns: the JSON document.
+    :rtype: str
+    """
+    return orjson.dumps(obj).decode()
+
+# use the fastest JSON library available, falling back to the standard library.
+if orjson is not None:
+    default_json_serialize = _orjson_dumps
+    default_json_deserialize = orjson.loads
+elif ujson is not None:
+    default_json_serialize = ujson.dumps
+    default_json_deserialize = ujson.loads
+else:
+    default_json_serialize = json.dumps
+    default_json_deserialize = json.loads
+
+
+class _PrettyFormat():
+    """Defer pprint formatting of a value until a log record is emitted.
+
+    :param value: the value to format.
+    :type value: any
+    """
+
+    def __init__(self, value):
+        self.value = value
+
+    def __str__(self):
+        return pprint.pformat(self.value)
+
 
 class AioApiSessionManager():
     """An async, retying, rate limited HTTP session manager.
 
     :param api_base: the root of the API host to connect to.
     :type api_base: str
-    :param headers: headers to add to the request.
+    :param headers: headers to add to the request. Assign a new dict to
+                    mgr.headers to change them later, changes made to the
+                    dict in place are not sent.
     :type headers: dict
     :param should_retry: a callable that accepts an exception and returns
                          True if the call should be retried. Set to None
@@ -68,7 +143,7 @@ class AioApiSessionManager():
     :param backoff: a callable that accepts the current number of attempts
                     and returns the time to sleep before retrying.
                     Set to None to disable backoff.
-                    Default: aio_api_sm.exponential_backoff_with_jitter
+                    Default: aio_api_sm.full_jitter_backoff
     :type backoff: function or None
     :param rate_limit: maximum number of request per second. Default: 5.
                        Disable with None or 0.
@@ -79,10 +154,39 @@ class AioApiSessionManager():
                          Set to 0 or None for unlimited. Default: None.
     :type max_requests: int or None
     :param limit_per_host: maximum number of connections to the host.
-                           must be >= rate_limit_burst to matter. Default: 20
+                           must be >= rate_limit_burst to matter. Default: 100
     :type limit_per_host: int
     :param ttl_dns_cache: time to live for cached dns records. Default: 300s
     :type ttl_dns_cache: int
+    :param async_resolver: resolve names on the event loop with aiodns,
+                           if it is installed. Default: True
+    :type async_resolver: bool
+    :param share_pool: share one connection pool, and its keep-alive
+                       connections and dns cache, with other managers on the
+                       same loop that use the same connector settings.
+                       Close shared pools with close_all. Default: False
+    :type share_pool: bool
+    :param max_concurrent: maximum number of requests in flight at once.
+                           Set to None for no limit. Default: None.
+    :type max_concurrent: int or None
+    :param adaptive_rate_limit: halve the rate limit while response times
+                                are more than latency_slowdown_factor times
+                                the fastest seen. Ignored if rate limiting
+                                is disabled. Default: False
+    :type adaptive_rate_limit: bool
+    :param json_serialize: a callable that serializes an object to a JSON str.
+                           Default: orjson or ujson if installed, else
+                           json.dumps.
+    :type json_serialize: function
+    :param json_deserialize: a callable that parses a JSON str.
+                             Default: orjson or ujson if installed, else
+                             json.loads. Unlike json.loads, orjson rejects
+                             NaN and Infinity, so those responses raise, and
+                             parses integers wider than 64 bits as floats,
+                             losing precision. ujson also differs from
+                             json.loads on these values. Pass json.loads to
+                             keep the standard library's behaviour.
+    :type json_deserialize: function
     :param ignore_400: treat 400 responses as ok.
     :type ignore_400: bool
     :param session_kwargs: key word arguments to pass to aiohttp.ClientSession
@@ -95,19 +199,38 @@ class AioApiSessionManager():
     # minimum queue length
     rate_limit_min_burst_size = 2
 
-    # minimum sleep for rate manager task between wakes
-    min_sleep = 0.1
+    # (connector, resolver) pairs shared between managers, keyed by loop and
+    # settings.
+    _shared_connectors = {}
 
     # how long to pause if we get a malformed 429
     default_retry_after_delay = 5
 
+    # maximum random delay added to a Retry-After wait so waiters don't
+    # all wake at once
+    retry_after_jitter = 0.2
+
+    # weight of the latest response time in the moving average
+    latency_ewma_alpha = 0.2
+
+    # how much slower than the baseline responses get before slowing down
+    latency_slowdown_factor = 2
+
     def __init__(self, api_base, headers=None, should_retry=default_retry,
-                 retries=6, backoff=exponential_backoff_with_jitter,
+                 retries=6, backoff=full_jitter_backoff,
                  rate_limit=5, rate_limit_burst=20, max_requests=None,
-                 limit_per_host=20, ttl_dns_cache=300,
-                 json_serialize=json.dumps, json_deserialize=json.loads,
+                 limit_per_host=100, ttl_dns_cache=300, async_resolver=True,
+                 share_pool=False, max_concurrent=None,
+                 adaptive_rate_limit=False,
+                 json_serialize=default_json_serialize,
+                 json_deserialize=default_json_deserialize,
                  ignore_400=False, **session_kwargs):
         self.api_base = api_base
+        self._session = None
+        # headers are set once on the session rather than on every request,
+        # manager headers take precedence over any passed for the session.
+        self._session_headers = CIMultiDict(
+                session_kwargs.pop('headers', None) or {})
         self.headers = headers
         self.retries = retries
         self.backoff = backoff
@@ -115,49 +238,182 @@ class AioApiSessionManager():
         self.max_requests = max_requests
         self.limit_per_host = limit_per_host
         self.ttl_dns_cache = ttl_dns_cache
+        self.async_resolver = async_resolver and aiodns is not None
+        self.share_pool = share_pool
+        self.max_concurrent = max_concurrent
+        self.adaptive_rate_limit = adaptive_rate_limit
         self.json_serialize = json_serialize
         self.json_deserialize = json_deserialize
         self.ignore_400 = ignore_400
         self.session_kwargs = session_kwargs
 
-        self.connector = aiohttp.TCPConnector(
-                    limit_per_host=self.limit_per_host,
-                    ttl_dns_cache=self.ttl_dns_cache)
-
-        self.retry_after_event = asyncio.Event()
-        self.retry_after_event.set()
-        self.retry_after_time = None
+        # loop bound resources are created by _ensure_started on first use.
+        self._started = False
+        self._connector = None
+        self._resolver = None
+        self._in_flight = None
+        self.retry_after_event = None
+        self._retry_after_handle = None
 
         self.rate_limit = rate_limit
         # if the max burst size is smaller than the rate limit, use the
         # rate limit as the max burst size.
-        self.rate_limit_burst = max(rate_limit, rate_limit_burst)
+        self.rate_limit_burst = max(rate_limit or 0, rate_limit_burst)
 
-        if self.rate_limit:
-            self._token_queue = asyncio.Queue(int(rate_limit_burst))
-            self._rate_manager_task = asyncio.create_task(self._rate_manager())
+        # the bucket starts full and is refilled lazily when tokens are taken.
+        self._tokens = float(self.rate_limit_burst)
+        self._last_refill = time.monotonic()
 
-        self.__session = None
-        self._start = time.monotonic()
+        # moving average of response times, and the lowest it has been.
+        self._latency_ewma = None
+        self._latency_baseline = None
+        self._slowed = False
+
+        # bind the shortcut verbs once rather than on every attribute access.
+        self._verb_methods = {
+                verb: functools.partial(self.request, verb)
+                for verb in self.shortcuts}
+
+        self._start = time.perf_counter()
         self._requests = 0
-        log.info(f'stated new session manager: {self}')
+        log.info('stated new session manager: %s', self)
 
     @property
-    def session(self):
+    def headers(self):
+        """Headers added to every request.
+
+        Setting new headers, to refresh an Authorization token for example,
+        also updates the default headers of an open session.
+
+        :returns: the headers.
+        :rtype: dict or None
+        """
+        return self._headers
+
+    @headers.setter
+    def headers(self, headers):
+        self._headers = headers
+        self._default_headers = CIMultiDict(self._session_headers)
+        self._default_headers.update(headers or {})
+        if self._session:
+            self._session.headers.clear()
+            self._session.headers.update(self._default_headers)
+
+    async def _ensure_started(self):
+        """Create the loop bound resources for this manager, once.
+
+        The connector and events must be created inside a running loop, so
+        they are deferred until the manager is first used.
+
+        :returns: None
+        """
+        if self._started:
+            return
+
+        if self.share_pool:
+            self._prune_shared_connectors()
+            key = (asyncio.get_running_loop(), self.limit_per_host,
+                   self.ttl_dns_cache, self.async_resolver)
+            if key not in self._shared_connectors:
+                self._shared_connectors[key] = self._create_connector()
+            self._connector, self._resolver = self._shared_connectors[key]
+        else:
+            self._connector, self._resolver = self._create_connector()
+
+        if self.max_concurrent:
+            self._in_flight = asyncio.Semaphore(self.max_concurrent)
+
+        self.retry_after_event = asyncio.Event()
+        self.retry_after_event.set()
+        self._started = True
+
+    def _create_connector(self):
+        """Create a new connector with this manager's settings.
+
+        The connector uses aiohttp's default resolver, which it owns and
+        closes, unless that isn't the kind asked for. A resolver passed to
+        the connector is never closed by it, so it is returned to be closed
+        with the connector.
+
+        :returns: the connector, and the resolver created for it or None.
+        :rtype: (aiohttp.TCPConnector, aiohttp.abc.AbstractResolver or None)
+        """
+        resolver = None
+        connector_kwargs = {}
+        wanted = AsyncResolver if self.async_resolver else ThreadedResolver
+        if DefaultResolver is not wanted:
+            resolver = wanted()
+            connector_kwargs['resolver'] = resolver
+        connector = aiohttp.TCPConnector(
+                    limit_per_host=self.limit_per_host,
+                    use_dns_cache=True,
+                    ttl_dns_cache=self.ttl_dns_cache,
+                    **connector_kwargs)
+        return connector, resolver
+
+    @staticmethod
+    async def _close_connector(connector, resolver):
+        """Close a connector and the resolver created for it, if any.
+
+        :param connector: the connector to close.
+        :type connector: aiohttp.TCPConnector
+        :param resolver: the resolver created for the connector, or None.
+        :type resolver: aiohttp.abc.AbstractResolver or None
+        :returns: None
+        """
+        if not connector.closed:
+            await connector.close()
+        if resolver:
+            await resolver.close()
+
+    @classmethod
+    def _prune_shared_connectors(cls):
+        """Forget shared connectors that are closed or whose loop is closed.
+
+        A connector can't be closed once its loop has closed, so dropping it
+        is all that can be done.
+
+        :returns: None
+        """
+        for key, (connector, _) in list(cls._shared_connectors.items()):
+            if connector.closed or key[0].is_closed():
+                del cls._shared_connectors[key]
+
+    @classmethod
+    async def close_all(cls):
+        """Close the connectors shared between managers on the running loop.
+
+        Call this once all managers using share_pool on this loop have been
+        closed.
+
+        :returns: None
+        """
+        loop = asyncio.get_running_loop()
+        for key, (connector, resolver) in list(
+                cls._shared_connectors.items()):
+            if key[0] is loop:
+                del cls._shared_connectors[key]
+                await cls._close_connector(connector, resolver)
+        cls._prune_shared_connectors()
+
+    async def _get_session(self):
         """Get the single instance of an aiohttp.ClientSession for this manager
 
         :returns session: returns the aiohttp.ClientSession for this manager.
         :rtype: aiohttp.ClientSession
         """
-        if not self.__session:
+        if not self._session:
+            await self._ensure_started()
             # inject the serializer chosen at init if not provided for session
             if 'json_serialize' not in self.session_kwargs:
                 self.session_kwargs['json_serialize'] = self.json_serialize
-            self.__session = aiohttp.ClientSession(
+            self._session = aiohttp.ClientSession(
                     self.api_base,
-                    connector=self.connector,
+                    connector=self._connector,
+                    connector_owner=not self.share_pool,
+                    headers=self._default_headers,
                     **self.session_kwargs)
-        return self.__session
+        return self._session
 
     async def close(self):
         """Close the Request Manager and underlying aiohttp.ClientSession.
@@ -167,89 +423,138 @@ class AioApiSessionManager():
 
         :returns: None
         """
-        secs = time.monotonic() - self._start
-        log.info(f"{self._requests} in {secs}s {self._requests/secs}req/s")
-        if self._rate_manager != None:
-            self._rate_manager_task.cancel()
-        if self.__session and not self.__session.closed:
-            try:
-                await self.__session.close()
-            except:
-                pass
-        self.__session = None
+        secs = time.perf_counter() - self._start
+        requests = self._requests
+        log.info("%s in %ss %sreq/s", requests, secs, requests / secs)
+        # end any Retry-After pause so no coroutine is left waiting on it.
+        if self._retry_after_handle:
+            self._retry_after_handle.cancel()
+            self._resume()
+
+        session, self._session = self._session, None
+        connector, self._connector = self._connector, None
+        resolver, self._resolver = self._resolver, None
+        self._started = False
+
+        # cancellation is not caught here, so shutdown can still cancel us.
+        try:
+            if session and not session.closed:
+                await session.close()
+            # the session owns the connector, but it may never have been
+            # created. shared connectors are left open for close_all.
+            if connector and not self.share_pool:
+                await self._close_connector(connector, resolver)
+        except (aiohttp.ClientError, OSError) as e:
+            log.debug('session close error: %s', e)
+
+    def _pause_for(self, seconds):
+        """Hold all requests for a number of seconds after a 429.
+
+        Clears the retry after event and schedules it to be set again. The
+        token bucket doesn't refill while paused. A pause that ends sooner
+        than one already scheduled is ignored.
+
+        :param seconds: seconds to pause for.
+        :type seconds: int or float
+        :returns: None
+        """
+        loop = asyncio.get_running_loop()
+        wake_at = loop.time() + seconds
+        if self._retry_after_handle:
+            if self._retry_after_handle.when() >= wake_at:
+                return
+            self._retry_after_handle.cancel()
+        elif self.rate_limit:
+            # bank the tokens dripped in so far, none are added while paused.
+            self._refill()
+        self.retry_after_event.clear()
+        self._retry_after_handle = loop.call_at(wake_at, self._resume)
 
-    def _sleep_duration(self):
-        """Get the loop sleep duration.
+    def _resume(self):
+        """Let requests continue once a Retry-After pause has passed.
 
-        It is generally 1/rate limit with a minimum of 0.1.
-        :returns: int or None is rate limiting isn't enabled.
+        :returns: None
         """
-        if self.rate_limit != None:
-            return max(1/self.rate_limit, self.min_sleep)
-        return None
+        self._retry_after_handle = None
+        # the bucket starts refilling again from now.
+        self._last_refill = time.monotonic()
+        self.retry_after_event.set()
+        log.debug('retry-after time has passed. event set.')
 
-    async def _rate_manager(self):
-        """A background task that fills our leaky bucket with tokens.
+    def _rate(self):
+        """Get the current rate limit, halved if responses have slowed.
 
-        The rate manager is automatically started when a new RequestsManager
-        is initialized.  It sticks token in the bucket to help rate limit
-        traffic.
+        :returns: requests per second.
+        :rtype: int or float
+        """
+        if self._slowed:
+            return self.rate_limit / 2
+        return self.rate_limit
 
+    def _record_latency(self, latency):
+        """Update the response time average and slow down if it has grown.
+
+        :param latency: seconds taken to get the response.
+        :type latency: float
         :returns: None
         """
-        try:
-            # if we don't have a queue or a rate limit,  notion to do.
-            if not (self.rate_limit and self._token_queue):
-                log.warning(f"Rate limit or token queue not set, no limiting.")
-                return
+        if self._latency_ewma is None:
+            self._latency_ewma = latency
+        else:
+            alpha = self.latency_ewma_alpha
+            self._latency_ewma = (
+                    alpha * latency + (1 - alpha) * self._latency_ewma)
+
+        if (self._latency_baseline is None
+                or self._latency_ewma < self._latency_baseline):
+            self._latency_baseline = self._latency_ewma
+
+        slowed = (self._latency_ewma >
+                  self.latency_slowdown_factor * self._latency_baseline)
+        if slowed != self._slowed:
+            log.warning('responses %s, rate limit now %s',
+                        'slowed' if slowed else 'recovered',
+                        self.rate_limit / 2 if slowed else self.rate_limit)
+            self._slowed = slowed
+
+    @contextlib.asynccontextmanager
+    async def _in_flight_slot(self):
+        """Hold one of the max_concurrent request slots, if limited.
+
+        :returns: None
+        """
+        if self._in_flight is None:
+            yield
+            return
+        async with self._in_flight:
+            yield
+
+    def _refill(self):
+        """Add the tokens that have dripped in since the last refill.
 
-            sleep = self._sleep_duration()
-            last_check_end = time.monotonic()
-            log.debug(f'starting rate manager '
-                      f'{self.rate_limit}/{self.rate_limit_burst}')
-
-            # start with a burst capable queue
-            for i in range(0, self._token_queue.maxsize):
-                self._token_queue.put_nowait(i)
-
-            # manage the rate
-            while True:
-                now = time.monotonic()
-
-                # if the retry after time has been set after a 429
-                # check to see if it has expired, if so, set the event.
-                if self.retry_after_time:
-                    if now >= self.retry_after_time:
-                        self.retry_after_event.set()
-                        self.retry_after_time = None
-                        log.debug(f'retry-after time has passed. event set.')
-                    else:
-                        retry_wake_in = self.retry_after_time - time.monotonic()
-                        log.warn(f'retry event unset. wake in {retry_wake_in}')
-                        await asyncio.sleep(retry_wake_in)
-
-                # if the bucket isn't overflowing and we aren't in retry wait
-                if not (self._token_queue.full() or self.retry_after_time):
-                    # we get rate_limit tokens per second
-                    # this implementation is crude, but works.
-                    time_tokens = self.rate_limit * (now - last_check_end)
-
-                    # don't add more tokens than the bucket can handle
-                    max_tokens = (self._token_queue.maxsize - \
-                                    self._token_queue.qsize())
-                    new_tokens = int(min(time_tokens, max_tokens))
-
-                    # add the tokens
-                    for i in range(0, new_tokens):
-                        self._token_queue.put_nowait(i)
-
-                # store the time and sleep the interval.
-                last_check_end = now
-                await asyncio.sleep(sleep)
-        except asyncio.CancelledError:
-            log.debug('Rate Manager Cancelled')
-        except Exception as err:
-            log.error(f'error in rate manager: {err}')
+        :returns: None
+        """
+        now = time.monotonic()
+        self._tokens = min(
+                self.rate_limit_burst,
+                self._tokens + (now - self._last_refill) * self._rate())
+        self._last_refill = now
+
+    def _take_token(self):
+        """Refill the bucket for the time elapsed and try to take a token.
+
+        There is no await between the refill and the take, so this is atomic
+        with respect to other coroutines on the loop.
+
+        :returns: True if a token was taken, else False.
+        :rtype: bool
+        """
+        self._refill()
+        if self._tokens >= 1:
+            self._tokens -= 1
+            log.debug('took token. remaining %s', self._tokens)
+            return True
+        return False
 
     async def _get_token(self):
         """Get a token from the bucket.
@@ -257,25 +562,29 @@ class AioApiSessionManager():
         Tokens are only given out when there are enough (we have rate limit
         space) and we are not in a Retry-After wait.
 
-        Calls to get_token will only return when both are true if rate limiting
-        is enabled, else it will always return immediately.
+        Calls to get_token will only return when both are true. If rate
+        limiting is disabled only the Retry-After wait applies.
 
         :returns: next token
         """
-        if self.max_requests and self._requests > self.max_requests:
-            raise MaximumRequestsExceeded(
-                    f'Used {self.requests - 1} of {self.max_requests}.')
+        await self._ensure_started()
 
-        if self.rate_limit:
-            # if we are in the penalty box, wait for the event
-            await self.retry_after_event.wait()
+        while True:
+            # if we are in the penalty box, wait for the event and then a
+            # little longer so the waiters don't all fire at once. this is
+            # checked after every sleep so that a pause also holds back
+            # requests already waiting for a token.
+            if not self.retry_after_event.is_set():
+                log.debug('waiting for retry-after to pass')
+                await self.retry_after_event.wait()
+                await asyncio.sleep(random.uniform(0, self.retry_after_jitter))
+                continue
 
-            if self._token_queue != None:
-                await self._token_queue.get()
-                self._token_queue.task_done()
-                log.debug(f'took token. remaining {self._token_queue.qsize()}')
+            if not self.rate_limit or self._take_token():
+                return None
 
-        return None
+            # sleep just long enough for the next token to drip in.
+            await asyncio.sleep((1 - self._tokens) / self._rate())
 
     async def request(self, method, path, *args, **kwargs):
         """Send a request with max requests, rate limiting, and retry.
@@ -297,48 +606,81 @@ class AioApiSessionManager():
         """
         request_content = kwargs.get('json', {})
 
-        log.debug("{} to {}: \n{}".format(
-            method, path, pprint.pformat(request_content)))
-
-        requests = 0
-
-        while requests < self.retries:
-            requests += 1
-            self._requests += 1
+        log.debug("%s to %s: \n%s",
+                  method, path, _PrettyFormat(request_content))
+
+        await self._ensure_started()
+        session = await self._get_session()
+
+        # count each request once, however many attempts it takes. the
+        # request holds its place in the budget through all of its retries.
+        if self.max_requests and self._requests >= self.max_requests:
+            raise MaxRequestsExceededError(
+                    f'Used {self._requests} of {self.max_requests}.')
+        self._requests += 1
+        attempts = 0
+        verb = method.upper()
+        # match ClientSession.head, which doesn't follow redirects by default.
+        if verb == 'HEAD':
+            kwargs.setdefault('allow_redirects', False)
+
+        while attempts < self.retries:
+            attempts += 1
+            resp = None
             try:
-                await self._get_token()
-                log.debug(f'{method} {path}: try {requests} started')
-                meth = getattr(self.session, method)
-                resp = await meth(path, headers=self.headers, *args, **kwargs)
-
-                resp_json = await resp.json(loads=self.json_deserialize)
-
-                if resp.status == 429:
-                    retry_after = resp.headers.get(
-                            'Retry-After', self.default_retry_after_delay)
-                    retry_after_secs = self._parse_retry_after(retry_after)
-                    self.retry_after_time = time.monotonic() + retry_after_secs
-                    self.retry_after_event.clear()
-                    log.warning(
-                            f"{method} {path}: 429 sleep {retry_after_secs}s")
-                else:
+                # take the slot before the token, so tokens aren't held
+                # while waiting for a slot and then spent all at once.
+                async with self._in_flight_slot():
+                    await self._get_token()
+                    log.debug('%s %s: try %s started', method, path, attempts)
+                    sent = time.perf_counter()
+                    resp = await session.request(verb, path, *args, **kwargs)
+                    # there is no rate to adapt if rate limiting is disabled.
+                    if self.adaptive_rate_limit and self.rate_limit:
+                        self._record_latency(time.perf_counter() - sent)
+
+                    if resp.status == 429:
+                        retry_after = resp.headers.get(
+                                'Retry-After', self.default_retry_after_delay)
+                        retry_after_secs = self._parse_retry_after(retry_after)
+                        self._pause_for(retry_after_secs)
+                        log.warning("%s %s: 429 sleep %ss",
+                                    method, path, retry_after_secs)
+                        # don't read the body of a rejected request.
+                        await resp.release()
+                        continue
+
                     resp.raise_for_status()
+
+                    # a body that isn't JSON is returned as an empty response,
+                    # it is still read so the connection can be reused.
+                    content_type = resp.content_type
+                    if not (content_type == 'application/json'
+                            or content_type.endswith('+json')):
+                        await resp.read()
+                        return {}
+
+                    # so is an empty body, but malformed JSON raises.
+                    resp_json = await resp.json(
+                            loads=self.json_deserialize, content_type=None)
+                    if resp_json is None:
+                        resp_json = {}
                     return resp_json
             except Exception as e:
-                log.error("Request {} to {} [{}/{}] failed: {}.".format(
-                    method, path, args, kwargs, e))
+                log.error("Request %s to %s [%s/%s] failed: %s.",
+                          method, path, args, kwargs, e)
                 # special 400 handling for RFPIO's search responses.
-                if resp.status == 400 and self.ignore_400:
+                if resp is not None and resp.status == 400 and self.ignore_400:
                     raise
-                if not (self.should_retry or self.should_retry(e)):
+                if not (self.should_retry and self.should_retry(e)):
                     raise
                 # we should retry, so do the backoff bit.
                 if self.backoff:
-                    backoff_time = self.backoff(requests)
-                    log.debug(f'{method} {path}: backoff {backoff_time}s')
+                    backoff_time = self.backoff(attempts)
+                    log.debug('%s %s: backoff %ss', method, path, backoff_time)
                     await asyncio.sleep(backoff_time)
             finally:
-                log.debug(f'{method} {path}: finished')
+                log.debug('%s %s: finished', method, path)
 
         raise RetriesExceededError(
                 f"{method} {path}: Maximum retries exceeded.")
@@ -352,28 +694,36 @@ class AioApiSessionManager():
         :returns: seconds to retry after.
         :rtype: int
         """
-        try:
-            seconds = int(value)
-            return seconds
-        except ValueError:
-            pass
+        if isinstance(value, int):
+            return value
+
+        # isdigit alone accepts non-ASCII digits, like '²', that int rejects.
+        value = value.strip()
+        if value.isascii() and value.isdigit():
+            return int(value)
 
         try:
-            date = parser.parse(value)
-            utcnow = datetime.now(timezone.utc)
-            seconds = (date - utcnow).seconds
-            return seconds
-        except parser.ParserError as e:
-            pass
+            date = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return self.default_retry_after_delay
 
-        return self.default_retry_after_delay
+        # dates with a -0000 offset parse as naive, treat them as UTC.
+        if date.tzinfo is None:
+            date = date.replace(tzinfo=timezone.utc)
+        seconds = (date - datetime.now(timezone.utc)).total_seconds()
+        return max(0, int(seconds))
 
     def __getattr__(self, attr):
         """Pass the shortcut http verb functions as a partial to request."""
-        if attr in self.shortcuts:
-            return functools.partial(self.request, attr)
+        try:
+            return self.__dict__['_verb_methods'][attr]
+        except KeyError:
+            pass
+        # don't format self here, __str__ reads attributes that may not be
+        # set yet and would come back through __getattr__.
+        cls = type(self)
         raise AttributeError(
-                f'{attr} doesnt exist on {self} or in {self.shortcuts}')
+                f'{attr} doesnt exist on {cls.__name__} or in {cls.shortcuts}')
 
     def __str__(self):
         return (f'AioApiSessionManager({self.api_base}, '